@@ -5,6 +5,13 @@ import json
 
 from slack_blocksmith.message import Message
 
+try:  # orjson encodes straight to bytes and is much faster than stdlib json
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_dumps = json.dumps
+
 # Example payload from Slack
 slack_payload = {
     "blocks": [
@@ -79,20 +86,25 @@ slack_payload = {
 }
 
 
+# The payload template is a module-level constant, so encode it once at
+# import time instead of on every run.
+_SLACK_PAYLOAD_JSON = _json_dumps(slack_payload)
+
+
 def main():
     """Demonstrate the usage of Message.from_payload."""
     print("=== Slack Blocksmith: Message.from_payload Example ===\n")
 
-    # Parse the Slack payload into a Message object
+    # Parse the Slack payload into a Message object. The payload is already
+    # a dict, so parse it directly rather than round-tripping through JSON.
     print("1. Parsing Slack payload into Message object...")
-    message = Message.from_payload(slack_payload)
+    message = Message.from_payload_dict(slack_payload)
     print(f"   ✓ Parsed {len(message.blocks)} blocks successfully")
 
-    # You can also parse from JSON string
-    print("\n2. Parsing from JSON string...")
-    json_payload = json.dumps(slack_payload)
-    message_from_json = Message.from_payload(json_payload)
-    print(f"   ✓ Parsed {len(message_from_json.blocks)} blocks from JSON string")
+    # Raw JSON from a webhook body can be parsed without decoding it first
+    print("\n2. Parsing raw JSON bytes...")
+    message_from_json = Message.from_payload_json(_SLACK_PAYLOAD_JSON)
+    print(f"   ✓ Parsed {len(message_from_json.blocks)} blocks from JSON")
 
     # Modify the message
     print("\n3. Modifying the message...")
@@ -104,29 +116,44 @@ def main():
     built_message = modified_message.build()
     print(f"   ✓ Built message with {len(built_message['blocks'])} blocks")
 
-    # Show the structure
+    # Or serialize straight to JSON bytes for an HTTP response body
+    json_body = modified_message.build_json()
+    print(f"   ✓ Serialized to {len(json_body)} bytes of JSON with build_json()")
+
+    # Show the structure (one buffered write instead of one print per block).
+    # Bind the block list and format method to locals so the loop avoids
+    # repeated subscript/attribute lookups.
     print("\n5. Message structure:")
-    for i, block in enumerate(built_message["blocks"]):
-        print(f"   Block {i + 1}: {block['type']} (id: {block.get('block_id', 'N/A')})")
+    blocks = built_message["blocks"]
+    fmt = "   Block {}: {} (id: {})".format
+    print(
+        "\n".join(
+            fmt(i + 1, block["type"], block.get("block_id", "N/A"))
+            for i, block in enumerate(blocks)
+        )
+    )
 
     print("\n=== Example Complete ===")
-    print("\nUsage in your Slack app:")
-    print("```python")
-    print("# In your action handler:")
-    print("def handle_button_click(payload):")
-    print("    # Parse the message from Slack payload")
-    print("    message = Message.from_payload(payload['message'])")
-    print("    ")
-    print("    # Modify the message")
-    print("    updated_message = message.add_section('Button was clicked!')")
-    print("    ")
-    print("    # Update the message in Slack")
-    print("    slack_client.chat_update(")
-    print("        channel=payload['channel']['id'],")
-    print("        ts=payload['message']['ts'],")
-    print("        blocks=updated_message.build()['blocks']")
-    print("    )")
-    print("```")
+    print(
+        """
+Usage in your Slack app:
+```python
+# In your action handler:
+def handle_button_click(payload):
+    # Parse the message from Slack payload
+    message = Message.from_payload(payload['message'])
+
+    # Modify the message
+    updated_message = message.add_section('Button was clicked!')
+
+    # Update the message in Slack
+    slack_client.chat_update(
+        channel=payload['channel']['id'],
+        ts=payload['message']['ts'],
+        blocks=updated_message.build()['blocks']
+    )
+```"""
+    )
 
 
 if __name__ == "__main__":
@@ -12,6 +12,16 @@ from .validators import (
     validate_url,
 )
 
+# Optional scalar video fields copied into build() output when set.
+_VIDEO_OPTIONAL_FIELDS = (
+    "title_url",
+    "thumbnail_url",
+    "alt_text",
+    "author_name",
+    "provider_name",
+    "provider_icon_url",
+)
+
 
 class Block(BaseModel):
     """Base class for blocks."""
@@ -484,20 +494,12 @@ class Video(Block):
                 "video_url": self.video_url,
             }
         )
-        if self.title_url is not None:
-            result["title_url"] = self.title_url
         if self.description is not None:
             result["description"] = self.description.build()
-        if self.thumbnail_url is not None:
-            result["thumbnail_url"] = self.thumbnail_url
-        if self.alt_text is not None:
-            result["alt_text"] = self.alt_text
-        if self.author_name is not None:
-            result["author_name"] = self.author_name
-        if self.provider_name is not None:
-            result["provider_name"] = self.provider_name
-        if self.provider_icon_url is not None:
-            result["provider_icon_url"] = self.provider_icon_url
+        for key in _VIDEO_OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
         return result
 
     @classmethod
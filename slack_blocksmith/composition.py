@@ -40,6 +40,10 @@ class PlainText(TextObject):
     @classmethod
     def create(cls, text: str, emoji: Optional[bool] = None) -> "PlainText":
         """Create a plain text object with builder pattern."""
+        # Leave emoji unset when not given so pydantic takes the
+        # default path instead of validating an explicit None.
+        if emoji is None:
+            return cls(text=text)
         return cls(text=text, emoji=emoji)
 
     def set_emoji(self, emoji: bool) -> "PlainText":
@@ -64,6 +68,8 @@ class MrkdwnText(TextObject):
     @classmethod
     def create(cls, text: str, verbatim: Optional[bool] = None) -> "MrkdwnText":
         """Create a markdown text object with builder pattern."""
+        if verbatim is None:
+            return cls(text=text)
         return cls(text=text, verbatim=verbatim)
 
     def set_verbatim(self, verbatim: bool) -> "MrkdwnText":
@@ -1,9 +1,35 @@
 """Message builders for Slack Block Kit."""
 
 import json
-from typing import Any, Dict, List, Literal, Optional, Union
+import sys
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+try:  # Optional fast path: orjson (de)serializes several times faster.
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    _json_loads = json.loads
 
-from pydantic import BaseModel, Field, field_validator
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
 from .blocks import (
     Actions,
@@ -19,8 +45,43 @@ from .blocks import (
     Video,
 )
 from .composition import MrkdwnText, PlainText
-from .elements import Element
-from .validators import SlackConstraints
+from .elements import (
+    Button,
+    ChannelsSelect,
+    Checkboxes,
+    ConversationsSelect,
+    DatePicker,
+    DatetimePicker,
+    Element,
+    EmailInput,
+    ExternalSelect,
+    FileInput,
+    Image as ImageElement,
+    MultiChannelsSelect,
+    MultiConversationsSelect,
+    MultiExternalSelect,
+    MultiStaticSelect,
+    MultiUsersSelect,
+    NumberInput,
+    Option,
+    OverflowMenu,
+    PlainTextInput,
+    RadioButtons,
+    RichTextInput,
+    StaticSelect,
+    TimePicker,
+    URLInput,
+    UsersSelect,
+)
+from .validators import SlackConstraints, validate_blocks_count
+
+# Optional top-level message fields copied into build() output when set.
+_MESSAGE_OPTIONAL_FIELDS = (
+    "response_type",
+    "replace_original",
+    "delete_original",
+    "metadata",
+)
 
 
 class Message(BaseModel):
@@ -32,29 +93,41 @@ class Message(BaseModel):
     delete_original: Optional[bool] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    _built_blocks: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
     @field_validator("blocks")
     @classmethod
     def validate_blocks(cls, v: List[Block]) -> List[Block]:
         """Validate number of blocks."""
-        if len(v) > SlackConstraints.MAX_BLOCKS_PER_MESSAGE:
-            raise ValueError(
-                f"Number of blocks {len(v)} exceeds maximum of {SlackConstraints.MAX_BLOCKS_PER_MESSAGE}"
-            )
-        return v
+        return validate_blocks_count(v, SlackConstraints.MAX_BLOCKS_PER_MESSAGE)
+
+    def _append_block(self, block: Block) -> "Message":
+        """Append a block, invalidating cached build output."""
+        self._built_blocks = None
+        self.blocks.append(block)
+        return self
 
     def build(self) -> Dict[str, Any]:
-        """Build the message as a dictionary."""
-        result = {"blocks": [block.build() for block in self.blocks]}
-        if self.response_type is not None:
-            result["response_type"] = self.response_type  # type: ignore[assignment]
-        if self.replace_original is not None:
-            result["replace_original"] = self.replace_original  # type: ignore[assignment]
-        if self.delete_original is not None:
-            result["delete_original"] = self.delete_original  # type: ignore[assignment]
-        if self.metadata is not None:
-            result["metadata"] = self.metadata  # type: ignore[assignment]
+        """Build the message as a dictionary.
+
+        Built block dictionaries are cached between calls and invalidated by
+        the ``add_*`` methods, so repeated builds of an unchanged message skip
+        re-serializing every block. Mutating a block in place after adding it
+        bypasses this cache; use the builder methods to modify a message.
+        """
+        if self._built_blocks is None:
+            self._built_blocks = [block.build() for block in self.blocks]
+        result: Dict[str, Any] = {"blocks": list(self._built_blocks)}
+        for key in _MESSAGE_OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
         return result
 
+    def build_json(self) -> bytes:
+        """Build the message and serialize it straight to JSON bytes."""
+        return _json_dumps(self.build())
+
     @classmethod
     def create(cls) -> "Message":
         """Create a message with builder pattern."""
@@ -62,7 +135,16 @@ class Message(BaseModel):
 
     def add_block(self, block: Block) -> "Message":
         """Add a block and return self for chaining."""
-        self.blocks.append(block)
+        return self._append_block(block)
+
+    def add_blocks(self, blocks: Iterable[Block]) -> "Message":
+        """Add several blocks at once and return self for chaining.
+
+        A single ``list.extend`` call, so bulk construction skips the
+        per-block method call of repeated :meth:`add_block`.
+        """
+        self._built_blocks = None
+        self.blocks.extend(blocks)
         return self
 
     def add_section(
@@ -76,14 +158,12 @@ class Message(BaseModel):
         section = Section.create(
             text=text, fields=fields, accessory=accessory, block_id=block_id
         )
-        self.blocks.append(section)
-        return self
+        return self._append_block(section)
 
     def add_divider(self, block_id: Optional[str] = None) -> "Message":
         """Add a divider block and return self for chaining."""
         divider = Divider.create(block_id=block_id)
-        self.blocks.append(divider)
-        return self
+        return self._append_block(divider)
 
     def add_image(
         self,
@@ -99,16 +179,14 @@ class Message(BaseModel):
             title=title,
             block_id=block_id,
         )
-        self.blocks.append(image)
-        return self
+        return self._append_block(image)
 
     def add_actions(
         self, elements: List[Element], block_id: Optional[str] = None
     ) -> "Message":
         """Add an actions block and return self for chaining."""
         actions = Actions.create(elements=elements, block_id=block_id)
-        self.blocks.append(actions)
-        return self
+        return self._append_block(actions)
 
     def add_context(
         self,
@@ -116,16 +194,15 @@ class Message(BaseModel):
         block_id: Optional[str] = None,
     ) -> "Message":
         """Add a context block and return self for chaining."""
-        context_elements: List[Union[PlainText, MrkdwnText, Element]] = []
-        for element in elements:
-            if isinstance(element, str):
-                context_elements.append(PlainText.create(element))
-            else:
-                context_elements.append(element)
-
+        plain_text = PlainText.create
+        # type-is check: str is never subclassed here and the pointer
+        # compare beats an isinstance call in this per-element loop.
+        context_elements: List[Union[PlainText, MrkdwnText, Element]] = [
+            plain_text(element) if type(element) is str else element
+            for element in elements
+        ]
         context = Context.create(elements=context_elements, block_id=block_id)
-        self.blocks.append(context)
-        return self
+        return self._append_block(context)
 
     def add_input(
         self,
@@ -145,20 +222,17 @@ class Message(BaseModel):
             dispatch_action=dispatch_action,
             block_id=block_id,
         )
-        self.blocks.append(input_block)
-        return self
+        return self._append_block(input_block)
 
     def add_file(self, external_id: str, block_id: Optional[str] = None) -> "Message":
         """Add a file block and return self for chaining."""
         file_block = File.create(external_id=external_id, block_id=block_id)
-        self.blocks.append(file_block)
-        return self
+        return self._append_block(file_block)
 
     def add_header(self, text: str, block_id: Optional[str] = None) -> "Message":
         """Add a header block and return self for chaining."""
         header = Header.create(text=text, block_id=block_id)
-        self.blocks.append(header)
-        return self
+        return self._append_block(header)
 
     def add_video(
         self,
@@ -186,16 +260,14 @@ class Message(BaseModel):
             provider_icon_url=provider_icon_url,
             block_id=block_id,
         )
-        self.blocks.append(video)
-        return self
+        return self._append_block(video)
 
     def add_rich_text(
         self, elements: List[Dict[str, Any]], block_id: Optional[str] = None
     ) -> "Message":
         """Add a rich text block and return self for chaining."""
         rich_text = RichText.create(elements=elements, block_id=block_id)
-        self.blocks.append(rich_text)
-        return self
+        return self._append_block(rich_text)
 
     def set_response_type(
         self, response_type: Literal["in_channel", "ephemeral"]
@@ -222,60 +294,51 @@ class Message(BaseModel):
     # Direct object methods
     def add_section_block(self, section: Section) -> "Message":
         """Add a section block directly and return self for chaining."""
-        self.blocks.append(section)
-        return self
+        return self._append_block(section)
 
     def add_divider_block(self, divider: Divider) -> "Message":
         """Add a divider block directly and return self for chaining."""
-        self.blocks.append(divider)
-        return self
+        return self._append_block(divider)
 
     def add_image_block(self, image: ImageBlock) -> "Message":
         """Add an image block directly and return self for chaining."""
-        self.blocks.append(image)
-        return self
+        return self._append_block(image)
 
     def add_actions_block(self, actions: Actions) -> "Message":
         """Add an actions block directly and return self for chaining."""
-        self.blocks.append(actions)
-        return self
+        return self._append_block(actions)
 
     def add_context_block(self, context: Context) -> "Message":
         """Add a context block directly and return self for chaining."""
-        self.blocks.append(context)
-        return self
+        return self._append_block(context)
 
     def add_input_block(self, input_block: Input) -> "Message":
         """Add an input block directly and return self for chaining."""
-        self.blocks.append(input_block)
-        return self
+        return self._append_block(input_block)
 
     def add_file_block(self, file_block: File) -> "Message":
         """Add a file block directly and return self for chaining."""
-        self.blocks.append(file_block)
-        return self
+        return self._append_block(file_block)
 
     def add_header_block(self, header: Header) -> "Message":
         """Add a header block directly and return self for chaining."""
-        self.blocks.append(header)
-        return self
+        return self._append_block(header)
 
     def add_video_block(self, video: Video) -> "Message":
         """Add a video block directly and return self for chaining."""
-        self.blocks.append(video)
-        return self
+        return self._append_block(video)
 
     def add_rich_text_block(self, rich_text: RichText) -> "Message":
         """Add a rich text block directly and return self for chaining."""
-        self.blocks.append(rich_text)
-        return self
+        return self._append_block(rich_text)
 
     @classmethod
-    def from_payload(cls, payload: Union[str, Dict[str, Any]]) -> "Message":
+    def from_payload(cls, payload: Union[str, bytes, Dict[str, Any]]) -> "Message":
         """Create a Message from a Slack payload JSON.
 
         Args:
-            payload: Either a JSON string or a dictionary containing the Slack payload
+            payload: A JSON string, JSON bytes or a dictionary containing the
+                Slack payload
 
         Returns:
             A Message object reconstructed from the payload
@@ -283,76 +346,123 @@ class Message(BaseModel):
         Raises:
             ValueError: If the payload is invalid or cannot be parsed
         """
-        if isinstance(payload, str):
-            try:
-                payload_dict = json.loads(payload)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON payload: {e}") from e
-        else:
-            payload_dict = payload
+        if isinstance(payload, (str, bytes)):
+            return cls.from_payload_json(payload)
+        return cls.from_payload_dict(payload)
+
+    @classmethod
+    def from_payload_json(cls, payload: Union[str, bytes]) -> "Message":
+        """Create a Message from a raw JSON payload.
+
+        A fast path for callers that already know the payload is a JSON
+        string or bytes, skipping the type dispatch in :meth:`from_payload`.
+
+        Args:
+            payload: A JSON string or JSON bytes containing the Slack payload
+
+        Returns:
+            A Message object reconstructed from the payload
+
+        Raises:
+            ValueError: If the payload is invalid or cannot be parsed
+        """
+        # Identical raw payloads are parsed once and served from a cache;
+        # a deep copy keeps the cached prototype safe from mutation.
+        return _from_payload_cached(payload).model_copy(deep=True)
+
+    @classmethod
+    def from_payload_dict(cls, payload_dict: Dict[str, Any]) -> "Message":
+        """Create a Message from an already-decoded payload dictionary.
+
+        A fast path for callers that already hold a dictionary, skipping
+        the type dispatch in :meth:`from_payload`.
+
+        Args:
+            payload_dict: A dictionary containing the Slack payload
+
+        Returns:
+            A Message object reconstructed from the payload
+
+        Raises:
+            ValueError: If the payload is invalid or cannot be parsed
+        """
+        return cls._from_payload_dict(payload_dict)
+
+    @classmethod
+    def from_payloads(
+        cls, payloads: Iterable[Union[str, bytes, Dict[str, Any]]]
+    ) -> List["Message"]:
+        """Create Messages from a batch of Slack payloads.
+
+        Args:
+            payloads: An iterable of JSON strings, JSON bytes or payload
+                dictionaries
+
+        Returns:
+            A list of Message objects, one per payload
+
+        Raises:
+            ValueError: If any payload is invalid or cannot be parsed
+        """
+        from_payload = cls.from_payload
+        return [from_payload(payload) for payload in payloads]
 
+    @classmethod
+    def _from_payload_dict(cls, payload_dict: Dict[str, Any]) -> "Message":
+        """Create a Message from an already-decoded payload dictionary."""
         if not isinstance(payload_dict, dict):
             raise ValueError("Payload must be a dictionary")
 
         # Extract blocks from payload
         blocks_data = payload_dict.get("blocks", [])
-        if blocks_data is not None and not isinstance(blocks_data, list):
+        # Exact-type check: JSON decoding only ever produces plain lists.
+        if type(blocks_data) is not list:
             raise ValueError("Blocks must be a list")
 
-        # Parse blocks
-        parsed_blocks = []
-        for block_data in blocks_data:
-            if not isinstance(block_data, dict):
-                raise ValueError("Each block must be a dictionary")
-            parsed_block = cls._parse_block(block_data)
-            parsed_blocks.append(parsed_block)
-
-        # Create message with parsed blocks
-        message = cls(blocks=parsed_blocks)
-
-        # Set other message properties if present
-        if "response_type" in payload_dict:
-            message.response_type = payload_dict["response_type"]
-        if "replace_original" in payload_dict:
-            message.replace_original = payload_dict["replace_original"]
-        if "delete_original" in payload_dict:
-            message.delete_original = payload_dict["delete_original"]
-        if "metadata" in payload_dict:
-            message.metadata = payload_dict["metadata"]
-
-        return message
+        # Parse blocks; the comprehension presizes the list in one pass.
+        parsed_blocks = [cls._parse_block(block_data) for block_data in blocks_data]
+
+        # Each block was already validated by its own constructor, so skip
+        # the Message-level pydantic pass and re-check only the count limit.
+        validate_blocks_count(parsed_blocks, SlackConstraints.MAX_BLOCKS_PER_MESSAGE)
+        # Pull the message-level properties through the same field table
+        # build() uses, so the two stay in sync.
+        get = payload_dict.get
+        return cls.model_construct(
+            blocks=parsed_blocks,
+            **{key: get(key) for key in _MESSAGE_OPTIONAL_FIELDS},
+        )
 
     @staticmethod
     def _parse_block(block_data: Dict[str, Any]) -> Block:
         """Parse a single block from JSON data."""
-        block_type = block_data.get("type")
+        # EAFP: blocks are well-formed in the common case, so try the type
+        # lookup directly and map the failure modes onto the usual errors.
+        try:
+            block_type = block_data["type"]
+        except TypeError:
+            raise ValueError("Each block must be a dictionary") from None
+        except KeyError:
+            raise ValueError("Block must have a type") from None
         if not block_type:
             raise ValueError("Block must have a type")
 
-        block_id = block_data.get("block_id")
-
-        if block_type == "section":
-            return Message._parse_section_block(block_data, block_id)
-        elif block_type == "divider":
-            return Divider.create(block_id=block_id)
-        elif block_type == "image":
-            return Message._parse_image_block(block_data, block_id)
-        elif block_type == "actions":
-            return Message._parse_actions_block(block_data, block_id)
-        elif block_type == "context":
-            return Message._parse_context_block(block_data, block_id)
-        elif block_type == "input":
-            return Message._parse_input_block(block_data, block_id)
-        elif block_type == "file":
-            return Message._parse_file_block(block_data, block_id)
-        elif block_type == "header":
-            return Message._parse_header_block(block_data, block_id)
-        elif block_type == "video":
-            return Message._parse_video_block(block_data, block_id)
-        elif block_type == "rich_text":
-            return Message._parse_rich_text_block(block_data, block_id)
-        else:
+        # Type strings decoded from JSON are fresh objects; interning them
+        # lets the dispatch lookup hit the pointer-equality fast path. A
+        # non-string type can never match, so skip straight to the error.
+        if not isinstance(block_type, str):
+            raise ValueError(f"Unsupported block type: {block_type}")
+        parser = _BLOCK_PARSERS.get(sys.intern(block_type))
+        if parser is None:
             raise ValueError(f"Unsupported block type: {block_type}")
+        return parser(block_data, block_data.get("block_id"))
+
+    @staticmethod
+    def _parse_divider_block(
+        block_data: Dict[str, Any], block_id: Optional[str]
+    ) -> Divider:
+        """Parse a divider block from JSON data."""
+        return Divider.create(block_id=block_id)
 
     @staticmethod
     def _parse_section_block(
@@ -365,9 +475,8 @@ class Message(BaseModel):
 
         fields = None
         if "fields" in block_data:
-            fields = [
-                Message._parse_text_object(field) for field in block_data["fields"]
-            ]
+            parse_text = Message._parse_text_object
+            fields = [parse_text(field) for field in block_data["fields"]]
 
         accessory = None
         if "accessory" in block_data:
@@ -390,12 +499,12 @@ class Message(BaseModel):
 
         title = None
         if "title" in block_data:
-            title = Message._parse_text_object(block_data["title"])
+            title = Message._extract_text(block_data["title"])
 
         return ImageBlock.create(
             image_url=image_url,
             alt_text=alt_text,
-            title=title.text if title else None,
+            title=title,
             block_id=block_id,
         )
 
@@ -405,7 +514,10 @@ class Message(BaseModel):
     ) -> Actions:
         """Parse an actions block from JSON data."""
         elements_data = block_data.get("elements", [])
-        elements = [Message._parse_element(elem) for elem in elements_data]
+        # Bind the parser to a local so the comprehension skips the
+        # per-element attribute lookup on Message.
+        parse_element = Message._parse_element
+        elements = [parse_element(elem) for elem in elements_data]
         return Actions.create(elements=elements, block_id=block_id)
 
     @staticmethod
@@ -414,12 +526,14 @@ class Message(BaseModel):
     ) -> Context:
         """Parse a context block from JSON data."""
         elements_data = block_data.get("elements", [])
-        elements = []
-        for elem_data in elements_data:
-            if elem_data.get("type") in ["plain_text", "mrkdwn"]:
-                elements.append(Message._parse_text_object(elem_data))
-            else:
-                elements.append(Message._parse_element(elem_data))
+        parse_text = Message._parse_text_object
+        parse_element = Message._parse_element
+        elements = [
+            parse_text(elem_data)
+            if elem_data.get("type") in ("plain_text", "mrkdwn")
+            else parse_element(elem_data)
+            for elem_data in elements_data
+        ]
         return Context.create(elements=elements, block_id=block_id)
 
     @staticmethod
@@ -430,7 +544,7 @@ class Message(BaseModel):
         label_data = block_data.get("label")
         if not label_data:
             raise ValueError("Input block must have a label")
-        label = Message._parse_text_object(label_data)
+        label = Message._extract_text(label_data)
 
         element_data = block_data.get("element")
         if not element_data:
@@ -439,15 +553,15 @@ class Message(BaseModel):
 
         hint = None
         if "hint" in block_data:
-            hint = Message._parse_text_object(block_data["hint"])
+            hint = Message._extract_text(block_data["hint"])
 
         optional = block_data.get("optional")
         dispatch_action = block_data.get("dispatch_action")
 
         return Input.create(
-            label=label.text,
+            label=label,
             element=element,
-            hint=hint.text if hint else None,
+            hint=hint,
             optional=optional,
             dispatch_action=dispatch_action,
             block_id=block_id,
@@ -469,8 +583,8 @@ class Message(BaseModel):
         text_data = block_data.get("text")
         if not text_data:
             raise ValueError("Header block must have text")
-        text = Message._parse_text_object(text_data)
-        return Header.create(text=text.text, block_id=block_id)
+        text = Message._extract_text(text_data)
+        return Header.create(text=text, block_id=block_id)
 
     @staticmethod
     def _parse_video_block(
@@ -483,7 +597,7 @@ class Message(BaseModel):
         if not title_data or not video_url:
             raise ValueError("Video block must have title and video_url")
 
-        title = Message._parse_text_object(title_data)
+        title = Message._extract_text(title_data)
 
         title_url = block_data.get("title_url")
         description = block_data.get("description")
@@ -494,7 +608,7 @@ class Message(BaseModel):
         provider_icon_url = block_data.get("provider_icon_url")
 
         return Video.create(
-            title=title.text,
+            title=title,
             video_url=video_url,
             title_url=title_url,
             description=description,
@@ -523,6 +637,10 @@ class Message(BaseModel):
         if not text_type or not text:
             raise ValueError("Text object must have type and text")
 
+        # Interning makes the comparisons below pointer-equality hits for
+        # type strings freshly decoded from JSON.
+        if isinstance(text_type, str):
+            text_type = sys.intern(text_type)
         if text_type == "plain_text":
             emoji = text_data.get("emoji")
             return PlainText.create(text=text, emoji=emoji)
@@ -532,6 +650,23 @@ class Message(BaseModel):
         else:
             raise ValueError(f"Unsupported text type: {text_type}")
 
+    @staticmethod
+    def _extract_text(text_data: Dict[str, Any]) -> str:
+        """Extract the raw string from a text object in JSON data.
+
+        Several parse paths unwrap ``.text`` immediately and discard the
+        wrapper; this performs the same validation as
+        :meth:`_parse_text_object` without constructing a model.
+        """
+        text_type = text_data.get("type")
+        text = text_data.get("text")
+
+        if not text_type or not text:
+            raise ValueError("Text object must have type and text")
+        if text_type != "plain_text" and text_type != "mrkdwn":
+            raise ValueError(f"Unsupported text type: {text_type}")
+        return text
+
     @staticmethod
     def _parse_element(element_data: Dict[str, Any]) -> Element:
         """Parse an element from JSON data."""
@@ -539,61 +674,18 @@ class Message(BaseModel):
         if not element_type:
             raise ValueError("Element must have a type")
 
-        if element_type == "button":
-            return Message._parse_button_element(element_data)
-        elif element_type == "checkboxes":
-            return Message._parse_checkboxes_element(element_data)
-        elif element_type == "datepicker":
-            return Message._parse_datepicker_element(element_data)
-        elif element_type == "timepicker":
-            return Message._parse_timepicker_element(element_data)
-        elif element_type == "datetimepicker":
-            return Message._parse_datetimepicker_element(element_data)
-        elif element_type == "email_text_input":
-            return Message._parse_email_input_element(element_data)
-        elif element_type == "number_input":
-            return Message._parse_number_input_element(element_data)
-        elif element_type == "plain_text_input":
-            return Message._parse_plain_text_input_element(element_data)
-        elif element_type == "url_text_input":
-            return Message._parse_url_input_element(element_data)
-        elif element_type == "radio_buttons":
-            return Message._parse_radio_buttons_element(element_data)
-        elif element_type == "static_select":
-            return Message._parse_static_select_element(element_data)
-        elif element_type == "external_select":
-            return Message._parse_external_select_element(element_data)
-        elif element_type == "users_select":
-            return Message._parse_users_select_element(element_data)
-        elif element_type == "conversations_select":
-            return Message._parse_conversations_select_element(element_data)
-        elif element_type == "channels_select":
-            return Message._parse_channels_select_element(element_data)
-        elif element_type == "multi_static_select":
-            return Message._parse_multi_static_select_element(element_data)
-        elif element_type == "multi_external_select":
-            return Message._parse_multi_external_select_element(element_data)
-        elif element_type == "overflow":
-            return Message._parse_overflow_element(element_data)
-        elif element_type == "file_input":
-            return Message._parse_file_input_element(element_data)
-        elif element_type == "rich_text_input":
-            return Message._parse_rich_text_input_element(element_data)
-        elif element_type == "image":
-            return Message._parse_image_element(element_data)
-        elif element_type == "multi_users_select":
-            return Message._parse_multi_users_select_element(element_data)
-        elif element_type == "multi_conversations_select":
-            return Message._parse_multi_conversations_select_element(element_data)
-        elif element_type == "multi_channels_select":
-            return Message._parse_multi_channels_select_element(element_data)
-        else:
+        # Same interned-key dispatch as _parse_block; one dict lookup
+        # replaces up to 24 string comparisons.
+        if not isinstance(element_type, str):
+            raise ValueError(f"Unsupported element type: {element_type}")
+        parser = _ELEMENT_PARSERS.get(sys.intern(element_type))
+        if parser is None:
             raise ValueError(f"Unsupported element type: {element_type}")
+        return parser(element_data)
 
     @staticmethod
     def _parse_button_element(element_data: Dict[str, Any]) -> "Button":
         """Parse a button element from JSON data."""
-        from .elements import Button
 
         text_data = element_data.get("text")
         action_id = element_data.get("action_id")
@@ -601,14 +693,14 @@ class Message(BaseModel):
         if not text_data or not action_id:
             raise ValueError("Button must have text and action_id")
 
-        text = Message._parse_text_object(text_data)
+        text = Message._extract_text(text_data)
 
         url = element_data.get("url")
         value = element_data.get("value")
         style = element_data.get("style")
 
         return Button.create(
-            text=text.text, action_id=action_id, url=url, value=value, style=style
+            text=text, action_id=action_id, url=url, value=value, style=style
         )
 
     # Add placeholder methods for other element types
@@ -616,7 +708,6 @@ class Message(BaseModel):
     @staticmethod
     def _parse_checkboxes_element(element_data: Dict[str, Any]) -> "Checkboxes":
         """Parse a checkboxes element from JSON data."""
-        from .elements import Checkboxes
 
         action_id = element_data.get("action_id")
         if not action_id:
@@ -638,7 +729,6 @@ class Message(BaseModel):
     @staticmethod
     def _parse_option(option_data: Dict[str, Any]) -> "Option":
         """Parse an option from JSON data."""
-        from .elements import Option
 
         text_data = option_data.get("text")
         value = option_data.get("value")
@@ -646,98 +736,53 @@ class Message(BaseModel):
         if not text_data or not value:
             raise ValueError("Option must have text and value")
 
-        text = Message._parse_text_object(text_data)
+        text = Message._extract_text(text_data)
 
         description = None
         if "description" in option_data:
-            description = Message._parse_text_object(option_data["description"])
+            description = Message._extract_text(option_data["description"])
 
         url = option_data.get("url")
 
         return Option.create(
-            text=text.text,
+            text=text,
             value=value,
-            description=description.text if description else None,
+            description=description,
             url=url,
         )
 
-    # Placeholder methods for other element types - these would be implemented similarly
-    @staticmethod
-    def _parse_datepicker_element(element_data: Dict[str, Any]) -> "DatePicker":
-        """Parse a datepicker element from JSON data."""
-        from .elements import DatePicker
-
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("DatePicker must have action_id")
-        return DatePicker.create(action_id=action_id)
-
-    @staticmethod
-    def _parse_timepicker_element(element_data: Dict[str, Any]) -> "TimePicker":
-        """Parse a timepicker element from JSON data."""
-        from .elements import TimePicker
-
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("TimePicker must have action_id")
-        return TimePicker.create(action_id=action_id)
-
-    @staticmethod
-    def _parse_datetimepicker_element(element_data: Dict[str, Any]) -> "DatetimePicker":
-        """Parse a datetimepicker element from JSON data."""
-        from .elements import DatetimePicker
-
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("DatetimePicker must have action_id")
-        return DatetimePicker.create(action_id=action_id)
-
     @staticmethod
-    def _parse_email_input_element(element_data: Dict[str, Any]) -> "EmailInput":
-        """Parse an email input element from JSON data."""
-        from .elements import EmailInput
-
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("EmailInput must have action_id")
-        return EmailInput.create(action_id=action_id)
-
-    @staticmethod
-    def _parse_number_input_element(element_data: Dict[str, Any]) -> "NumberInput":
-        """Parse a number input element from JSON data."""
-        from .elements import NumberInput
-
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("NumberInput must have action_id")
-        return NumberInput.create(action_id=action_id)
-
-    @staticmethod
-    def _parse_plain_text_input_element(
-        element_data: Dict[str, Any],
-    ) -> "PlainTextInput":
-        """Parse a plain text input element from JSON data."""
-        from .elements import PlainTextInput
-
+    def _parse_simple_element(
+        element_data: Dict[str, Any], cls: Type[Element]
+    ) -> Element:
+        """Parse an element whose only JSON input is its action_id.
+
+        The pickers and text-style inputs all reduce to the same
+        check-and-create; the concrete class is bound per element type in
+        the dispatch table.
+        """
         action_id = element_data.get("action_id")
         if not action_id:
-            raise ValueError("PlainTextInput must have action_id")
-        return PlainTextInput.create(action_id=action_id)
+            raise ValueError(f"{cls.__name__} must have action_id")
+        return cls.create(action_id=action_id)
 
     @staticmethod
-    def _parse_url_input_element(element_data: Dict[str, Any]) -> "URLInput":
-        """Parse a URL input element from JSON data."""
-        from .elements import URLInput
+    def _parse_select_with_placeholder(
+        element_data: Dict[str, Any], cls: Type[Element]
+    ) -> Element:
+        """Parse a select element carrying only action_id and placeholder.
 
-        action_id = element_data.get("action_id")
-        if not action_id:
-            raise ValueError("URLInput must have action_id")
-        return URLInput.create(action_id=action_id)
+        Covers the user/conversation/channel selects and their multi
+        variants plus the external selects, which share this exact shape.
+        """
+        action_id, placeholder = Message._extract_action_and_placeholder(
+            element_data, cls.__name__
+        )
+        return cls.create(action_id=action_id, placeholder=placeholder)
 
     @staticmethod
     def _parse_radio_buttons_element(element_data: Dict[str, Any]) -> "RadioButtons":
         """Parse a radio buttons element from JSON data."""
-        from .elements import RadioButtons
 
         action_id = element_data.get("action_id")
         if not action_id:
@@ -747,15 +792,28 @@ class Message(BaseModel):
         return RadioButtons.create(action_id=action_id, options=options)
 
     @staticmethod
-    def _parse_static_select_element(element_data: Dict[str, Any]) -> "StaticSelect":
-        """Parse a static select element from JSON data."""
-        from .elements import StaticSelect
-
+    def _extract_action_and_placeholder(
+        element_data: Dict[str, Any], cls_name: str
+    ) -> Tuple[str, str]:
+        """Extract the action_id and placeholder text a select element needs.
+
+        Every select parser starts with the same two lookups and the same
+        presence check; doing them in one place halves the per-parser
+        bytecode and keeps the error messages uniform.
+        """
         action_id = element_data.get("action_id")
         placeholder_data = element_data.get("placeholder")
         if not action_id or not placeholder_data:
-            raise ValueError("StaticSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
+            raise ValueError(f"{cls_name} must have action_id and placeholder")
+        return action_id, Message._extract_text(placeholder_data)
+
+    @staticmethod
+    def _parse_static_select_element(element_data: Dict[str, Any]) -> "StaticSelect":
+        """Parse a static select element from JSON data."""
+
+        action_id, placeholder = Message._extract_action_and_placeholder(
+            element_data, "StaticSelect"
+        )
         options_data = element_data.get("options", [])
         options = (
             [Message._parse_option(opt) for opt in options_data]
@@ -763,77 +821,18 @@ class Message(BaseModel):
             else None
         )
         return StaticSelect.create(
-            action_id=action_id, placeholder=placeholder.text, options=options
-        )
-
-    @staticmethod
-    def _parse_external_select_element(
-        element_data: Dict[str, Any],
-    ) -> "ExternalSelect":
-        """Parse an external select element from JSON data."""
-        from .elements import ExternalSelect
-
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("ExternalSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return ExternalSelect.create(action_id=action_id, placeholder=placeholder.text)
-
-    @staticmethod
-    def _parse_users_select_element(element_data: Dict[str, Any]) -> "UsersSelect":
-        """Parse a users select element from JSON data."""
-        from .elements import UsersSelect
-
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("UsersSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return UsersSelect.create(action_id=action_id, placeholder=placeholder.text)
-
-    @staticmethod
-    def _parse_conversations_select_element(
-        element_data: Dict[str, Any],
-    ) -> "ConversationsSelect":
-        """Parse a conversations select element from JSON data."""
-        from .elements import ConversationsSelect
-
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("ConversationsSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return ConversationsSelect.create(
-            action_id=action_id, placeholder=placeholder.text
+            action_id=action_id, placeholder=placeholder, options=options
         )
 
-    @staticmethod
-    def _parse_channels_select_element(
-        element_data: Dict[str, Any],
-    ) -> "ChannelsSelect":
-        """Parse a channels select element from JSON data."""
-        from .elements import ChannelsSelect
-
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("ChannelsSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return ChannelsSelect.create(action_id=action_id, placeholder=placeholder.text)
-
     @staticmethod
     def _parse_multi_static_select_element(
         element_data: Dict[str, Any],
     ) -> "MultiStaticSelect":
         """Parse a multi static select element from JSON data."""
-        from .elements import MultiStaticSelect
 
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("MultiStaticSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
+        action_id, placeholder = Message._extract_action_and_placeholder(
+            element_data, "MultiStaticSelect"
+        )
         options_data = element_data.get("options", [])
         options = (
             [Message._parse_option(opt) for opt in options_data]
@@ -841,29 +840,12 @@ class Message(BaseModel):
             else None
         )
         return MultiStaticSelect.create(
-            action_id=action_id, placeholder=placeholder.text, options=options
-        )
-
-    @staticmethod
-    def _parse_multi_external_select_element(
-        element_data: Dict[str, Any],
-    ) -> "MultiExternalSelect":
-        """Parse a multi external select element from JSON data."""
-        from .elements import MultiExternalSelect
-
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("MultiExternalSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return MultiExternalSelect.create(
-            action_id=action_id, placeholder=placeholder.text
+            action_id=action_id, placeholder=placeholder, options=options
         )
 
     @staticmethod
     def _parse_overflow_element(element_data: Dict[str, Any]) -> "OverflowMenu":
         """Parse an overflow element from JSON data."""
-        from .elements import OverflowMenu
 
         action_id = element_data.get("action_id")
         if not action_id:
@@ -875,7 +857,6 @@ class Message(BaseModel):
     @staticmethod
     def _parse_file_input_element(element_data: Dict[str, Any]) -> "FileInput":
         """Parse a file input element from JSON data."""
-        from .elements import FileInput
 
         action_id = element_data.get("action_id")
         if not action_id:
@@ -885,7 +866,6 @@ class Message(BaseModel):
     @staticmethod
     def _parse_rich_text_input_element(element_data: Dict[str, Any]) -> "RichTextInput":
         """Parse a rich text input element from JSON data."""
-        from .elements import RichTextInput
 
         action_id = element_data.get("action_id")
         if not action_id:
@@ -895,7 +875,6 @@ class Message(BaseModel):
     @staticmethod
     def _parse_image_element(element_data: Dict[str, Any]) -> "ImageElement":
         """Parse an image element from JSON data."""
-        from .elements import Image as ImageElement
 
         image_url = element_data.get("image_url")
         alt_text = element_data.get("alt_text")
@@ -903,165 +882,143 @@ class Message(BaseModel):
             raise ValueError("Image element must have image_url and alt_text")
         return ImageElement.create(image_url=image_url, alt_text=alt_text)
 
-    @staticmethod
-    def _parse_multi_users_select_element(
-        element_data: Dict[str, Any],
-    ) -> "MultiUsersSelect":
-        """Parse a multi users select element from JSON data."""
-        from .elements import MultiUsersSelect
 
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("MultiUsersSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return MultiUsersSelect.create(
-            action_id=action_id, placeholder=placeholder.text
-        )
+# Type -> parser lookup table, built once at import time so block dispatch
+# is a single dict lookup instead of a chain of string comparisons.
+_BLOCK_PARSERS: Dict[str, Callable[[Dict[str, Any], Optional[str]], Block]] = {
+    "section": Message._parse_section_block,
+    "divider": Message._parse_divider_block,
+    "image": Message._parse_image_block,
+    "actions": Message._parse_actions_block,
+    "context": Message._parse_context_block,
+    "input": Message._parse_input_block,
+    "file": Message._parse_file_block,
+    "header": Message._parse_header_block,
+    "video": Message._parse_video_block,
+    "rich_text": Message._parse_rich_text_block,
+}
+
+# Same table-driven dispatch for interactive elements, whose type chain
+# is more than twice as long as the block one.
+_ELEMENT_PARSERS: Dict[str, Callable[[Dict[str, Any]], Element]] = {
+    "button": Message._parse_button_element,
+    "checkboxes": Message._parse_checkboxes_element,
+    "datepicker": partial(Message._parse_simple_element, cls=DatePicker),
+    "timepicker": partial(Message._parse_simple_element, cls=TimePicker),
+    "datetimepicker": partial(Message._parse_simple_element, cls=DatetimePicker),
+    "email_text_input": partial(Message._parse_simple_element, cls=EmailInput),
+    "number_input": partial(Message._parse_simple_element, cls=NumberInput),
+    "plain_text_input": partial(Message._parse_simple_element, cls=PlainTextInput),
+    "url_text_input": partial(Message._parse_simple_element, cls=URLInput),
+    "radio_buttons": Message._parse_radio_buttons_element,
+    "static_select": Message._parse_static_select_element,
+    "external_select": partial(Message._parse_select_with_placeholder, cls=ExternalSelect),
+    "users_select": partial(Message._parse_select_with_placeholder, cls=UsersSelect),
+    "conversations_select": partial(Message._parse_select_with_placeholder, cls=ConversationsSelect),
+    "channels_select": partial(Message._parse_select_with_placeholder, cls=ChannelsSelect),
+    "multi_static_select": Message._parse_multi_static_select_element,
+    "multi_external_select": partial(Message._parse_select_with_placeholder, cls=MultiExternalSelect),
+    "multi_users_select": partial(Message._parse_select_with_placeholder, cls=MultiUsersSelect),
+    "multi_conversations_select": partial(Message._parse_select_with_placeholder, cls=MultiConversationsSelect),
+    "multi_channels_select": partial(Message._parse_select_with_placeholder, cls=MultiChannelsSelect),
+    "overflow": Message._parse_overflow_element,
+    "file_input": Message._parse_file_input_element,
+    "rich_text_input": Message._parse_rich_text_input_element,
+    "image": Message._parse_image_element,
+}
+
+
+@lru_cache(maxsize=128)
+def _from_payload_cached(payload: Union[str, bytes]) -> Message:
+    """Decode and parse a raw JSON payload, caching the resulting Message."""
+    try:
+        payload_dict = _json_loads(payload)
+    except ValueError as e:
+        # Constant message keeps the error path cheap; the decode detail
+        # (position, snippet) stays reachable through __cause__.
+        raise ValueError("Invalid JSON payload") from e
+    return Message._from_payload_dict(payload_dict)
+
+
+# Optional modal fields copied into build() output when set; the flag marks
+# values emitted as plain-text objects rather than raw values.
+_MODAL_OPTIONAL_FIELDS = (
+    ("submit", True),
+    ("close", True),
+    ("private_metadata", False),
+    ("callback_id", False),
+    ("clear_on_close", False),
+    ("notify_on_close", False),
+    ("external_id", False),
+)
 
-    @staticmethod
-    def _parse_multi_conversations_select_element(
-        element_data: Dict[str, Any],
-    ) -> "MultiConversationsSelect":
-        """Parse a multi conversations select element from JSON data."""
-        from .elements import MultiConversationsSelect
+# Optional home tab fields copied into build() output when set.
+_HOME_TAB_OPTIONAL_FIELDS = ("private_metadata", "callback_id", "external_id")
 
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError(
-                "MultiConversationsSelect must have action_id and placeholder"
-            )
-        placeholder = Message._parse_text_object(placeholder_data)
-        return MultiConversationsSelect.create(
-            action_id=action_id, placeholder=placeholder.text
-        )
+_ContainerT = TypeVar("_ContainerT", bound="_BlockContainerMixin")
 
-    @staticmethod
-    def _parse_multi_channels_select_element(
-        element_data: Dict[str, Any],
-    ) -> "MultiChannelsSelect":
-        """Parse a multi channels select element from JSON data."""
-        from .elements import MultiChannelsSelect
 
-        action_id = element_data.get("action_id")
-        placeholder_data = element_data.get("placeholder")
-        if not action_id or not placeholder_data:
-            raise ValueError("MultiChannelsSelect must have action_id and placeholder")
-        placeholder = Message._parse_text_object(placeholder_data)
-        return MultiChannelsSelect.create(
-            action_id=action_id, placeholder=placeholder.text
-        )
+def _plain_text(text: str) -> Dict[str, str]:
+    """Build the minimal plain-text object used for modal chrome fields."""
+    return {"type": "plain_text", "text": text}
 
 
-class Modal(BaseModel):
-    """Modal builder for Slack Block Kit."""
+class _BlockContainerMixin:
+    """Shared block-builder methods for the view containers (Modal, HomeTab).
 
-    type: Literal["modal"] = "modal"
-    title: str
-    blocks: List[Block] = Field(default_factory=list)
-    submit: Optional[str] = None
-    close: Optional[str] = None
-    private_metadata: Optional[str] = None
-    callback_id: Optional[str] = None
-    clear_on_close: Optional[bool] = None
-    notify_on_close: Optional[bool] = None
-    external_id: Optional[str] = None
+    The two classes carry identical ``add_*`` and ``set_*`` builders; hosting
+    them here keeps one copy of the bytecode and one place to maintain them.
+    The concrete pydantic fields live on the subclasses.
+    """
 
-    @field_validator("blocks")
-    @classmethod
-    def validate_blocks(cls, v: List[Block]) -> List[Block]:
-        """Validate number of blocks."""
-        if len(v) > SlackConstraints.MAX_BLOCKS_PER_MODAL:
-            raise ValueError(
-                f"Number of blocks {len(v)} exceeds maximum of {SlackConstraints.MAX_BLOCKS_PER_MODAL}"
-            )
-        return v
+    if TYPE_CHECKING:
+        blocks: List[Block]
+        private_metadata: Optional[str]
+        callback_id: Optional[str]
+        external_id: Optional[str]
+        _built_blocks: Optional[List[Dict[str, Any]]]
 
-    def build(self) -> Dict[str, Any]:
-        """Build the modal as a dictionary."""
-        # Validate block count before building
-        if len(self.blocks) > SlackConstraints.MAX_BLOCKS_PER_MODAL:
-            raise ValueError(
-                f"Number of blocks {len(self.blocks)} exceeds maximum of {SlackConstraints.MAX_BLOCKS_PER_MODAL}"
-            )
-        result = {
-            "type": self.type,
-            "title": {"type": "plain_text", "text": self.title},
-            "blocks": [block.build() for block in self.blocks],
-        }
-        if self.submit is not None:
-            result["submit"] = {"type": "plain_text", "text": self.submit}
-        if self.close is not None:
-            result["close"] = {"type": "plain_text", "text": self.close}
-        if self.private_metadata is not None:
-            result["private_metadata"] = self.private_metadata
-        if self.callback_id is not None:
-            result["callback_id"] = self.callback_id
-        if self.clear_on_close is not None:
-            result["clear_on_close"] = self.clear_on_close  # type: ignore[assignment]
-        if self.notify_on_close is not None:
-            result["notify_on_close"] = self.notify_on_close  # type: ignore[assignment]
-        if self.external_id is not None:
-            result["external_id"] = self.external_id
-        return result
+        def build(self) -> Dict[str, Any]: ...
 
-    @classmethod
-    def create(
-        cls,
-        title: str,
-        submit: Optional[str] = None,
-        close: Optional[str] = None,
-        private_metadata: Optional[str] = None,
-        callback_id: Optional[str] = None,
-        clear_on_close: Optional[bool] = None,
-        notify_on_close: Optional[bool] = None,
-        external_id: Optional[str] = None,
-    ) -> "Modal":
-        """Create a modal with builder pattern."""
-        return cls(
-            title=title,
-            submit=submit,
-            close=close,
-            private_metadata=private_metadata,
-            callback_id=callback_id,
-            clear_on_close=clear_on_close,
-            notify_on_close=notify_on_close,
-            external_id=external_id,
-        )
+    def build_json(self) -> bytes:
+        """Build the view and serialize it straight to JSON bytes."""
+        return _json_dumps(self.build())
 
-    def add_block(self, block: Block) -> "Modal":
-        """Add a block and return self for chaining."""
+    def _append_block(self: _ContainerT, block: Block) -> _ContainerT:
+        """Append a block, invalidating cached build output."""
+        self._built_blocks = None
         self.blocks.append(block)
         return self
 
+    def add_block(self: _ContainerT, block: Block) -> _ContainerT:
+        """Add a block and return self for chaining."""
+        return self._append_block(block)
+
     def add_section(
-        self,
-        text: Optional[str] = None,
-        fields: Optional[List[str]] = None,
+        self: _ContainerT,
+        text: Optional[Union[str, PlainText, MrkdwnText]] = None,
+        fields: Optional[List[Union[str, PlainText, MrkdwnText]]] = None,
         accessory: Optional[Element] = None,
         block_id: Optional[str] = None,
-    ) -> "Modal":
+    ) -> _ContainerT:
         """Add a section block and return self for chaining."""
         section = Section.create(
             text=text, fields=fields, accessory=accessory, block_id=block_id
         )
-        self.blocks.append(section)
-        return self
+        return self._append_block(section)
 
-    def add_divider(self, block_id: Optional[str] = None) -> "Modal":
+    def add_divider(self: _ContainerT, block_id: Optional[str] = None) -> _ContainerT:
         """Add a divider block and return self for chaining."""
         divider = Divider.create(block_id=block_id)
-        self.blocks.append(divider)
-        return self
+        return self._append_block(divider)
 
     def add_image(
-        self,
+        self: _ContainerT,
         image_url: str,
         alt_text: str,
         title: Optional[str] = None,
         block_id: Optional[str] = None,
-    ) -> "Modal":
+    ) -> _ContainerT:
         """Add an image block and return self for chaining."""
         image = ImageBlock.create(
             image_url=image_url,
@@ -1069,43 +1026,40 @@ class Modal(BaseModel):
             title=title,
             block_id=block_id,
         )
-        self.blocks.append(image)
-        return self
+        return self._append_block(image)
 
     def add_actions(
-        self, elements: List[Element], block_id: Optional[str] = None
-    ) -> "Modal":
+        self: _ContainerT, elements: List[Element], block_id: Optional[str] = None
+    ) -> _ContainerT:
         """Add an actions block and return self for chaining."""
         actions = Actions.create(elements=elements, block_id=block_id)
-        self.blocks.append(actions)
-        return self
+        return self._append_block(actions)
 
     def add_context(
-        self,
+        self: _ContainerT,
         elements: List[Union[Element, str]],
         block_id: Optional[str] = None,
-    ) -> "Modal":
+    ) -> _ContainerT:
         """Add a context block and return self for chaining."""
-        context_elements: List[Union[PlainText, MrkdwnText, Element]] = []
-        for element in elements:
-            if isinstance(element, str):
-                context_elements.append(PlainText.create(element))
-            else:
-                context_elements.append(element)
-
+        plain_text = PlainText.create
+        # type-is check: str is never subclassed here and the pointer
+        # compare beats an isinstance call in this per-element loop.
+        context_elements: List[Union[PlainText, MrkdwnText, Element]] = [
+            plain_text(element) if type(element) is str else element
+            for element in elements
+        ]
         context = Context.create(elements=context_elements, block_id=block_id)
-        self.blocks.append(context)
-        return self
+        return self._append_block(context)
 
     def add_input(
-        self,
+        self: _ContainerT,
         label: str,
         element: Element,
         hint: Optional[str] = None,
         optional: Optional[bool] = None,
         dispatch_action: Optional[bool] = None,
         block_id: Optional[str] = None,
-    ) -> "Modal":
+    ) -> _ContainerT:
         """Add an input block and return self for chaining."""
         input_block = Input.create(
             label=label,
@@ -1115,23 +1069,20 @@ class Modal(BaseModel):
             dispatch_action=dispatch_action,
             block_id=block_id,
         )
-        self.blocks.append(input_block)
-        return self
+        return self._append_block(input_block)
 
-    def add_file(self, external_id: str, block_id: Optional[str] = None) -> "Modal":
+    def add_file(self: _ContainerT, external_id: str, block_id: Optional[str] = None) -> _ContainerT:
         """Add a file block and return self for chaining."""
         file_block = File.create(external_id=external_id, block_id=block_id)
-        self.blocks.append(file_block)
-        return self
+        return self._append_block(file_block)
 
-    def add_header(self, text: str, block_id: Optional[str] = None) -> "Modal":
+    def add_header(self: _ContainerT, text: str, block_id: Optional[str] = None) -> _ContainerT:
         """Add a header block and return self for chaining."""
         header = Header.create(text=text, block_id=block_id)
-        self.blocks.append(header)
-        return self
+        return self._append_block(header)
 
     def add_video(
-        self,
+        self: _ContainerT,
         title: str,
         video_url: str,
         title_url: Optional[str] = None,
@@ -1142,7 +1093,7 @@ class Modal(BaseModel):
         provider_name: Optional[str] = None,
         provider_icon_url: Optional[str] = None,
         block_id: Optional[str] = None,
-    ) -> "Modal":
+    ) -> _ContainerT:
         """Add a video block and return self for chaining."""
         video = Video.create(
             title=title,
@@ -1156,355 +1107,210 @@ class Modal(BaseModel):
             provider_icon_url=provider_icon_url,
             block_id=block_id,
         )
-        self.blocks.append(video)
-        return self
+        return self._append_block(video)
 
     def add_rich_text(
-        self, elements: List[Dict[str, Any]], block_id: Optional[str] = None
-    ) -> "Modal":
+        self: _ContainerT, elements: List[Dict[str, Any]], block_id: Optional[str] = None
+    ) -> _ContainerT:
         """Add a rich text block and return self for chaining."""
         rich_text = RichText.create(elements=elements, block_id=block_id)
-        self.blocks.append(rich_text)
-        return self
-
-    def set_submit(self, text: str) -> "Modal":
-        """Set submit button text and return self for chaining."""
-        self.submit = text
-        return self
-
-    def set_close(self, text: str) -> "Modal":
-        """Set close button text and return self for chaining."""
-        self.close = text
-        return self
+        return self._append_block(rich_text)
 
-    def set_private_metadata(self, metadata: str) -> "Modal":
+    def set_private_metadata(self: _ContainerT, metadata: str) -> _ContainerT:
         """Set private metadata and return self for chaining."""
         self.private_metadata = metadata
         return self
 
-    def set_callback_id(self, callback_id: str) -> "Modal":
+    def set_callback_id(self: _ContainerT, callback_id: str) -> _ContainerT:
         """Set callback ID and return self for chaining."""
         self.callback_id = callback_id
         return self
 
-    def set_clear_on_close(self, clear: bool) -> "Modal":
-        """Set clear on close and return self for chaining."""
-        self.clear_on_close = clear
-        return self
-
-    def set_notify_on_close(self, notify: bool) -> "Modal":
-        """Set notify on close and return self for chaining."""
-        self.notify_on_close = notify
-        return self
-
-    def set_external_id(self, external_id: str) -> "Modal":
+    def set_external_id(self: _ContainerT, external_id: str) -> _ContainerT:
         """Set external ID and return self for chaining."""
         self.external_id = external_id
         return self
 
     # Direct object methods
-    def add_section_block(self, section: Section) -> "Modal":
+
+    def add_section_block(self: _ContainerT, section: Section) -> _ContainerT:
         """Add a section block directly and return self for chaining."""
-        self.blocks.append(section)
-        return self
+        return self._append_block(section)
 
-    def add_divider_block(self, divider: Divider) -> "Modal":
+    def add_divider_block(self: _ContainerT, divider: Divider) -> _ContainerT:
         """Add a divider block directly and return self for chaining."""
-        self.blocks.append(divider)
-        return self
+        return self._append_block(divider)
 
-    def add_image_block(self, image: ImageBlock) -> "Modal":
+    def add_image_block(self: _ContainerT, image: ImageBlock) -> _ContainerT:
         """Add an image block directly and return self for chaining."""
-        self.blocks.append(image)
-        return self
+        return self._append_block(image)
 
-    def add_actions_block(self, actions: Actions) -> "Modal":
+    def add_actions_block(self: _ContainerT, actions: Actions) -> _ContainerT:
         """Add an actions block directly and return self for chaining."""
-        self.blocks.append(actions)
-        return self
+        return self._append_block(actions)
 
-    def add_context_block(self, context: Context) -> "Modal":
+    def add_context_block(self: _ContainerT, context: Context) -> _ContainerT:
         """Add a context block directly and return self for chaining."""
-        self.blocks.append(context)
-        return self
+        return self._append_block(context)
 
-    def add_input_block(self, input_block: Input) -> "Modal":
+    def add_input_block(self: _ContainerT, input_block: Input) -> _ContainerT:
         """Add an input block directly and return self for chaining."""
-        self.blocks.append(input_block)
-        return self
+        return self._append_block(input_block)
 
-    def add_file_block(self, file_block: File) -> "Modal":
+    def add_file_block(self: _ContainerT, file_block: File) -> _ContainerT:
         """Add a file block directly and return self for chaining."""
-        self.blocks.append(file_block)
-        return self
+        return self._append_block(file_block)
 
-    def add_header_block(self, header: Header) -> "Modal":
+    def add_header_block(self: _ContainerT, header: Header) -> _ContainerT:
         """Add a header block directly and return self for chaining."""
-        self.blocks.append(header)
-        return self
+        return self._append_block(header)
 
-    def add_video_block(self, video: Video) -> "Modal":
+    def add_video_block(self: _ContainerT, video: Video) -> _ContainerT:
         """Add a video block directly and return self for chaining."""
-        self.blocks.append(video)
-        return self
+        return self._append_block(video)
 
-    def add_rich_text_block(self, rich_text: RichText) -> "Modal":
+    def add_rich_text_block(self: _ContainerT, rich_text: RichText) -> _ContainerT:
         """Add a rich text block directly and return self for chaining."""
-        self.blocks.append(rich_text)
-        return self
+        return self._append_block(rich_text)
 
 
-class HomeTab(BaseModel):
-    """Home tab builder for Slack Block Kit."""
 
-    type: Literal["home"] = "home"
+class Modal(_BlockContainerMixin, BaseModel):
+    """Modal builder for Slack Block Kit."""
+
+    type: Literal["modal"] = "modal"
+    title: str
     blocks: List[Block] = Field(default_factory=list)
+    submit: Optional[str] = None
+    close: Optional[str] = None
     private_metadata: Optional[str] = None
     callback_id: Optional[str] = None
+    clear_on_close: Optional[bool] = None
+    notify_on_close: Optional[bool] = None
     external_id: Optional[str] = None
 
+    _built_blocks: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
     @field_validator("blocks")
     @classmethod
     def validate_blocks(cls, v: List[Block]) -> List[Block]:
         """Validate number of blocks."""
-        if len(v) > SlackConstraints.MAX_BLOCKS_PER_HOME_TAB:
-            raise ValueError(
-                f"Number of blocks {len(v)} exceeds maximum of {SlackConstraints.MAX_BLOCKS_PER_HOME_TAB}"
-            )
-        return v
+        return validate_blocks_count(v, SlackConstraints.MAX_BLOCKS_PER_MODAL)
 
     def build(self) -> Dict[str, Any]:
-        """Build the home tab as a dictionary."""
-        # Validate block count before building
-        if len(self.blocks) > SlackConstraints.MAX_BLOCKS_PER_HOME_TAB:
-            raise ValueError(
-                f"Number of blocks {len(self.blocks)} exceeds maximum of {SlackConstraints.MAX_BLOCKS_PER_HOME_TAB}"
-            )
-        result = {
+        """Build the modal as a dictionary.
+
+        Built block dictionaries are cached between calls and invalidated
+        by the ``add_*`` methods, as on :class:`Message`.
+        """
+        # The validator only runs at construction, so re-check appended blocks.
+        validate_blocks_count(self.blocks, SlackConstraints.MAX_BLOCKS_PER_MODAL)
+        if self._built_blocks is None:
+            self._built_blocks = [block.build() for block in self.blocks]
+        result: Dict[str, Any] = {
             "type": self.type,
-            "blocks": [block.build() for block in self.blocks],
+            "title": _plain_text(self.title),
+            "blocks": list(self._built_blocks),
         }
-        if self.private_metadata is not None:
-            result["private_metadata"] = self.private_metadata
-        if self.callback_id is not None:
-            result["callback_id"] = self.callback_id
-        if self.external_id is not None:
-            result["external_id"] = self.external_id
+        for key, wrap in _MODAL_OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = _plain_text(value) if wrap else value
         return result
 
     @classmethod
     def create(
         cls,
+        title: str,
+        submit: Optional[str] = None,
+        close: Optional[str] = None,
         private_metadata: Optional[str] = None,
         callback_id: Optional[str] = None,
+        clear_on_close: Optional[bool] = None,
+        notify_on_close: Optional[bool] = None,
         external_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Create a home tab with builder pattern."""
+    ) -> "Modal":
+        """Create a modal with builder pattern."""
         return cls(
+            title=title,
+            submit=submit,
+            close=close,
             private_metadata=private_metadata,
             callback_id=callback_id,
+            clear_on_close=clear_on_close,
+            notify_on_close=notify_on_close,
             external_id=external_id,
         )
 
-    def add_block(self, block: Block) -> "HomeTab":
-        """Add a block and return self for chaining."""
-        self.blocks.append(block)
+    def set_submit(self, text: str) -> "Modal":
+        """Set submit button text and return self for chaining."""
+        self.submit = text
         return self
 
-    def add_section(
-        self,
-        text: Optional[Union[str, PlainText, MrkdwnText]] = None,
-        fields: Optional[List[Union[str, PlainText, MrkdwnText]]] = None,
-        accessory: Optional[Element] = None,
-        block_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Add a section block and return self for chaining."""
-        section = Section.create(
-            text=text, fields=fields, accessory=accessory, block_id=block_id
-        )
-        self.blocks.append(section)
+    def set_close(self, text: str) -> "Modal":
+        """Set close button text and return self for chaining."""
+        self.close = text
         return self
 
-    def add_divider(self, block_id: Optional[str] = None) -> "HomeTab":
-        """Add a divider block and return self for chaining."""
-        divider = Divider.create(block_id=block_id)
-        self.blocks.append(divider)
+    def set_clear_on_close(self, clear: bool) -> "Modal":
+        """Set clear on close and return self for chaining."""
+        self.clear_on_close = clear
         return self
 
-    def add_image(
-        self,
-        image_url: str,
-        alt_text: str,
-        title: Optional[str] = None,
-        block_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Add an image block and return self for chaining."""
-        image = ImageBlock.create(
-            image_url=image_url,
-            alt_text=alt_text,
-            title=title,
-            block_id=block_id,
-        )
-        self.blocks.append(image)
+    def set_notify_on_close(self, notify: bool) -> "Modal":
+        """Set notify on close and return self for chaining."""
+        self.notify_on_close = notify
         return self
 
-    def add_actions(
-        self, elements: List[Element], block_id: Optional[str] = None
-    ) -> "HomeTab":
-        """Add an actions block and return self for chaining."""
-        actions = Actions.create(elements=elements, block_id=block_id)
-        self.blocks.append(actions)
-        return self
 
-    def add_context(
-        self,
-        elements: List[Union[Element, str]],
-        block_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Add a context block and return self for chaining."""
-        context_elements: List[Union[PlainText, MrkdwnText, Element]] = []
-        for element in elements:
-            if isinstance(element, str):
-                context_elements.append(PlainText.create(element))
-            else:
-                context_elements.append(element)
+class HomeTab(_BlockContainerMixin, BaseModel):
+    """Home tab builder for Slack Block Kit."""
 
-        context = Context.create(elements=context_elements, block_id=block_id)
-        self.blocks.append(context)
-        return self
+    type: Literal["home"] = "home"
+    blocks: List[Block] = Field(default_factory=list)
+    private_metadata: Optional[str] = None
+    callback_id: Optional[str] = None
+    external_id: Optional[str] = None
 
-    def add_input(
-        self,
-        label: str,
-        element: Element,
-        hint: Optional[str] = None,
-        optional: Optional[bool] = None,
-        dispatch_action: Optional[bool] = None,
-        block_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Add an input block and return self for chaining."""
-        input_block = Input.create(
-            label=label,
-            element=element,
-            hint=hint,
-            optional=optional,
-            dispatch_action=dispatch_action,
-            block_id=block_id,
-        )
-        self.blocks.append(input_block)
-        return self
+    _built_blocks: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
 
-    def add_file(self, external_id: str, block_id: Optional[str] = None) -> "HomeTab":
-        """Add a file block and return self for chaining."""
-        file_block = File.create(external_id=external_id, block_id=block_id)
-        self.blocks.append(file_block)
-        return self
+    @field_validator("blocks")
+    @classmethod
+    def validate_blocks(cls, v: List[Block]) -> List[Block]:
+        """Validate number of blocks."""
+        return validate_blocks_count(v, SlackConstraints.MAX_BLOCKS_PER_HOME_TAB)
 
-    def add_header(self, text: str, block_id: Optional[str] = None) -> "HomeTab":
-        """Add a header block and return self for chaining."""
-        header = Header.create(text=text, block_id=block_id)
-        self.blocks.append(header)
-        return self
+    def build(self) -> Dict[str, Any]:
+        """Build the home tab as a dictionary.
 
-    def add_video(
-        self,
-        title: str,
-        video_url: str,
-        title_url: Optional[str] = None,
-        description: Optional[str] = None,
-        thumbnail_url: Optional[str] = None,
-        alt_text: Optional[str] = None,
-        author_name: Optional[str] = None,
-        provider_name: Optional[str] = None,
-        provider_icon_url: Optional[str] = None,
-        block_id: Optional[str] = None,
-    ) -> "HomeTab":
-        """Add a video block and return self for chaining."""
-        video = Video.create(
-            title=title,
-            video_url=video_url,
-            title_url=title_url,
-            description=description,
-            thumbnail_url=thumbnail_url,
-            alt_text=alt_text,
-            author_name=author_name,
-            provider_name=provider_name,
-            provider_icon_url=provider_icon_url,
-            block_id=block_id,
-        )
-        self.blocks.append(video)
-        return self
+        Built block dictionaries are cached between calls and invalidated
+        by the ``add_*`` methods, as on :class:`Message`.
+        """
+        # The validator only runs at construction, so re-check appended blocks.
+        validate_blocks_count(self.blocks, SlackConstraints.MAX_BLOCKS_PER_HOME_TAB)
+        if self._built_blocks is None:
+            self._built_blocks = [block.build() for block in self.blocks]
+        result: Dict[str, Any] = {
+            "type": self.type,
+            "blocks": list(self._built_blocks),
+        }
+        for key in _HOME_TAB_OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        return result
 
-    def add_rich_text(
-        self, elements: List[Dict[str, Any]], block_id: Optional[str] = None
+    @classmethod
+    def create(
+        cls,
+        private_metadata: Optional[str] = None,
+        callback_id: Optional[str] = None,
+        external_id: Optional[str] = None,
     ) -> "HomeTab":
-        """Add a rich text block and return self for chaining."""
-        rich_text = RichText.create(elements=elements, block_id=block_id)
-        self.blocks.append(rich_text)
-        return self
-
-    def set_private_metadata(self, metadata: str) -> "HomeTab":
-        """Set private metadata and return self for chaining."""
-        self.private_metadata = metadata
-        return self
-
-    def set_callback_id(self, callback_id: str) -> "HomeTab":
-        """Set callback ID and return self for chaining."""
-        self.callback_id = callback_id
-        return self
-
-    def set_external_id(self, external_id: str) -> "HomeTab":
-        """Set external ID and return self for chaining."""
-        self.external_id = external_id
-        return self
-
-    # Direct object methods
-    def add_section_block(self, section: Section) -> "HomeTab":
-        """Add a section block directly and return self for chaining."""
-        self.blocks.append(section)
-        return self
-
-    def add_divider_block(self, divider: Divider) -> "HomeTab":
-        """Add a divider block directly and return self for chaining."""
-        self.blocks.append(divider)
-        return self
-
-    def add_image_block(self, image: ImageBlock) -> "HomeTab":
-        """Add an image block directly and return self for chaining."""
-        self.blocks.append(image)
-        return self
-
-    def add_actions_block(self, actions: Actions) -> "HomeTab":
-        """Add an actions block directly and return self for chaining."""
-        self.blocks.append(actions)
-        return self
-
-    def add_context_block(self, context: Context) -> "HomeTab":
-        """Add a context block directly and return self for chaining."""
-        self.blocks.append(context)
-        return self
-
-    def add_input_block(self, input_block: Input) -> "HomeTab":
-        """Add an input block directly and return self for chaining."""
-        self.blocks.append(input_block)
-        return self
-
-    def add_file_block(self, file_block: File) -> "HomeTab":
-        """Add a file block directly and return self for chaining."""
-        self.blocks.append(file_block)
-        return self
-
-    def add_header_block(self, header: Header) -> "HomeTab":
-        """Add a header block directly and return self for chaining."""
-        self.blocks.append(header)
-        return self
-
-    def add_video_block(self, video: Video) -> "HomeTab":
-        """Add a video block directly and return self for chaining."""
-        self.blocks.append(video)
-        return self
+        """Create a home tab with builder pattern."""
+        return cls(
+            private_metadata=private_metadata,
+            callback_id=callback_id,
+            external_id=external_id,
+        )
 
-    def add_rich_text_block(self, rich_text: RichText) -> "HomeTab":
-        """Add a rich text block directly and return self for chaining."""
-        self.blocks.append(rich_text)
-        return self
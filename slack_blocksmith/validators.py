@@ -76,6 +76,15 @@ def validate_url(
     return url
 
 
+def validate_blocks_count(blocks: List[Any], max_count: int) -> List[Any]:
+    """Validate number of blocks."""
+    if len(blocks) > max_count:
+        raise ValueError(
+            f"Number of blocks {len(blocks)} exceeds maximum of {max_count}"
+        )
+    return blocks
+
+
 def validate_options_count(options: List[Any], max_count: int) -> List[Any]:
     """Validate number of options."""
     if len(options) > max_count:
@@ -1,8 +1,11 @@
 """Tests for message builders."""
 
+import json
+
 import pytest
 
 from slack_blocksmith.blocks import (
+    Divider,
     Section,
 )
 from slack_blocksmith.composition import MrkdwnText, PlainText
@@ -161,6 +164,15 @@ class TestMessage:
         assert len(message.blocks) == 1
         assert message.blocks[0] == section
 
+    def test_add_blocks(self):
+        """Test adding several blocks at once."""
+        section = Section.create("Hello World")
+        divider = Divider.create()
+        message = Message.create().add_blocks([section, divider])
+        assert len(message.blocks) == 2
+        assert message.blocks[0] == section
+        assert message.blocks[1] == divider
+
     def test_builder_pattern(self):
         """Test builder pattern for message."""
         message = (
@@ -202,6 +214,30 @@ class TestMessage:
         }
         assert result == expected
 
+    def test_build_json(self):
+        """Test building message to JSON bytes."""
+        message = Message.create().add_section("Hello World")
+        result = message.build_json()
+        assert isinstance(result, bytes)
+        assert json.loads(result) == message.build()
+
+    def test_build_cache_repeated_calls(self):
+        """Test that repeated builds return equal, independent results."""
+        message = Message.create().add_section("Hello").add_divider()
+        first = message.build()
+        second = message.build()
+        assert first == second
+        assert first is not second
+
+    def test_build_cache_invalidated_by_add(self):
+        """Test that adding a block after build is reflected in the next build."""
+        message = Message.create().add_section("Hello")
+        assert len(message.build()["blocks"]) == 1
+        message.add_divider()
+        built = message.build()
+        assert len(built["blocks"]) == 2
+        assert built["blocks"][1]["type"] == "divider"
+
 
 class TestModal:
     """Test Modal builder."""
@@ -302,6 +338,13 @@ class TestModal:
         }
         assert result == expected
 
+    def test_build_json(self):
+        """Test building modal to JSON bytes."""
+        modal = Modal.create("Modal Title").add_section("Hello World")
+        result = modal.build_json()
+        assert isinstance(result, bytes)
+        assert json.loads(result) == modal.build()
+
     def test_blocks_count_validation(self):
         """Test modal blocks count validation."""
         modal = Modal.create("Modal Title")
@@ -387,6 +430,13 @@ class TestHomeTab:
         }
         assert result == expected
 
+    def test_build_json(self):
+        """Test building home tab to JSON bytes."""
+        home_tab = HomeTab.create().add_section("Hello World")
+        result = home_tab.build_json()
+        assert isinstance(result, bytes)
+        assert json.loads(result) == home_tab.build()
+
     def test_blocks_count_validation(self):
         """Test home tab blocks count validation."""
         home_tab = HomeTab.create()
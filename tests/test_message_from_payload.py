@@ -6,6 +6,88 @@ import pytest
 
 from slack_blocksmith.message import Message
 
+# Complex real-world payload shared by read-only tests. Built once at
+# import time instead of per test; tests that mutate a payload must copy.
+_COMPLEX_PAYLOAD = {
+    "blocks": [
+        {
+            "type": "header",
+            "block_id": "K67Rr",
+            "text": {
+                "type": "plain_text",
+                "text": ":api2: Integration Tests Results :api2:",
+                "emoji": True,
+            },
+        },
+        {
+            "type": "context",
+            "block_id": "pA80d",
+            "elements": [
+                {
+                    "type": "mrkdwn",
+                    "text": "&gt;*Environment*: `staging`  |  *Branch*: `master`",
+                    "verbatim": False,
+                }
+            ],
+        },
+        {"type": "divider", "block_id": "6MYH6"},
+        {
+            "type": "section",
+            "block_id": "LIdd9",
+            "accessory": {
+                "type": "button",
+                "action_id": "workflow_btn_clicked",
+                "style": "danger",
+                "text": {
+                    "type": "plain_text",
+                    "text": ":github-white:",
+                    "emoji": True,
+                },
+                "url": "https://example.com",
+            },
+            "fields": [
+                {
+                    "type": "mrkdwn",
+                    "text": ":x: qa_platform *0.00%* (0/0)",
+                    "verbatim": False,
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "*Something went wrong*",
+                    "verbatim": False,
+                },
+            ],
+        },
+        {
+            "type": "actions",
+            "block_id": "Xt2Cs",
+            "elements": [
+                {
+                    "type": "button",
+                    "action_id": "workflow_btn_clicked",
+                    "text": {
+                        "type": "plain_text",
+                        "text": ":github-white: Workflow",
+                        "emoji": True,
+                    },
+                    "style": "primary",
+                    "url": "https://example.com",
+                },
+                {
+                    "type": "button",
+                    "action_id": "ai_analysis_clicked",
+                    "text": {
+                        "type": "plain_text",
+                        "text": ":robot_face: AI Analysis",
+                        "emoji": True,
+                    },
+                    "style": "primary",
+                },
+            ],
+        },
+    ]
+}
+
 
 class TestMessageFromPayload:
     """Test cases for Message.from_payload method."""
@@ -162,6 +244,31 @@ class TestMessageFromPayload:
         assert built["blocks"][0]["type"] == "header"
         assert built["blocks"][1]["type"] == "section"
 
+    def test_from_payload_dict_fast_path(self):
+        """Test the dict-specific entry point."""
+        message = Message.from_payload_dict({"blocks": [{"type": "divider"}]})
+        assert len(message.blocks) == 1
+        assert message.blocks[0].type == "divider"
+
+    def test_from_payload_json_fast_path(self):
+        """Test the JSON-specific entry point with str and bytes."""
+        payload = json.dumps({"blocks": [{"type": "divider"}]})
+        message = Message.from_payload_json(payload)
+        assert message.blocks[0].type == "divider"
+        message_from_bytes = Message.from_payload_json(payload.encode())
+        assert message_from_bytes.blocks[0].type == "divider"
+
+    def test_from_payloads_batch(self):
+        """Test parsing a batch of payloads."""
+        payloads = [
+            {"blocks": [{"type": "divider"}]},
+            json.dumps({"blocks": []}),
+        ]
+        messages = Message.from_payloads(payloads)
+        assert len(messages) == 2
+        assert messages[0].blocks[0].type == "divider"
+        assert messages[1].blocks == []
+
     def test_from_payload_invalid_json_raises_error(self):
         """Test that invalid JSON raises ValueError."""
         with pytest.raises(ValueError, match="Invalid JSON payload"):
@@ -194,87 +301,7 @@ class TestMessageFromPayload:
 
     def test_from_payload_complex_example(self):
         """Test parsing a complex real-world example."""
-        payload = {
-            "blocks": [
-                {
-                    "type": "header",
-                    "block_id": "K67Rr",
-                    "text": {
-                        "type": "plain_text",
-                        "text": ":api2: Integration Tests Results :api2:",
-                        "emoji": True,
-                    },
-                },
-                {
-                    "type": "context",
-                    "block_id": "pA80d",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": "&gt;*Environment*: `staging`  |  *Branch*: `master`",
-                            "verbatim": False,
-                        }
-                    ],
-                },
-                {"type": "divider", "block_id": "6MYH6"},
-                {
-                    "type": "section",
-                    "block_id": "LIdd9",
-                    "accessory": {
-                        "type": "button",
-                        "action_id": "workflow_btn_clicked",
-                        "style": "danger",
-                        "text": {
-                            "type": "plain_text",
-                            "text": ":github-white:",
-                            "emoji": True,
-                        },
-                        "url": "https://example.com",
-                    },
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": ":x: qa_platform *0.00%* (0/0)",
-                            "verbatim": False,
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": "*Something went wrong*",
-                            "verbatim": False,
-                        },
-                    ],
-                },
-                {
-                    "type": "actions",
-                    "block_id": "Xt2Cs",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "action_id": "workflow_btn_clicked",
-                            "text": {
-                                "type": "plain_text",
-                                "text": ":github-white: Workflow",
-                                "emoji": True,
-                            },
-                            "style": "primary",
-                            "url": "https://example.com",
-                        },
-                        {
-                            "type": "button",
-                            "action_id": "ai_analysis_clicked",
-                            "text": {
-                                "type": "plain_text",
-                                "text": ":robot_face: AI Analysis",
-                                "emoji": True,
-                            },
-                            "style": "primary",
-                        },
-                    ],
-                },
-            ]
-        }
-
-        message = Message.from_payload(payload)
+        message = Message.from_payload(_COMPLEX_PAYLOAD)
         assert len(message.blocks) == 5
 
         # Verify header